@@ -1,125 +1,226 @@
-from collections import UserDict
-from datetime import datetime, date, timedelta
-import pickle
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import re
+import sys
+
+
+_PHONE_RE = re.compile(r"\A[0-9]{10}\Z")
+
+# Зсув дати привітання за днем тижня: субота → +2, неділя → +1 (на понеділок)
+_SHIFT_DAYS = (0, 0, 0, 0, 0, 2, 1)
+
+
+def _validate_phone(value) -> str:
+    """Перевіряє, що номер складається рівно з 10 цифр, і повертає його."""
+    if not (isinstance(value, str) and _PHONE_RE.match(value)):
+        raise ValueError(
+            f"Номер телефону має складатися з 10 цифр, отримано: '{value}'"
+        )
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _parse_birthday(value: str) -> tuple:
+    """Розбирає дату DD.MM.YYYY і повертає пару (date, канонічний рядок).
+
+    Канонічний запис розбирається вручну; інші варіанти, які приймає strptime
+    (наприклад, 1.1.2000), — через strptime. Результат кешується.
+    """
+    digits = value[0:2] + value[3:5] + value[6:10]
+    if (len(value) == 10 and value[2] == "." and value[5] == "."
+            and digits.isascii() and digits.isdigit()):
+        try:
+            return date(int(value[6:10]), int(value[3:5]), int(value[0:2])), value
+        except ValueError:
+            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    try:
+        parsed = datetime.strptime(value, "%d.%m.%Y").date()
+    except ValueError:
+        raise ValueError("Invalid date format. Use DD.MM.YYYY")
+    return parsed, parsed.strftime("%d.%m.%Y")
+
+
+def _birthday_in_year(year: int, month: int, day: int) -> date:
+    """Дата дня народження в заданому році; 29 лютого у невисокосний рік — 28-е."""
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return date(year, 2, 28)
+
+
+def _restore_slots(obj, state):
+    """Відновлює стан об'єкта з __slots__ після unpickle.
+
+    Збереження, зроблені до появи __slots__, містять стан як звичайний __dict__,
+    нові — як пару (None, {слот: значення}).
+    """
+    if isinstance(state, tuple):
+        state = state[1]
+    for key, value in state.items():
+        setattr(obj, key, value)
 
 
 class Field:
     """Базовий клас для полів запису."""
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
+    def __setstate__(self, state):
+        _restore_slots(self, state)
+
     def __str__(self):
         return str(self.value)
 
 
 class Name(Field):
     """Клас для зберігання імені контакту."""
-    pass
+    __slots__ = ()
 
 
 class Phone(Field):
     """Клас для зберігання номера телефону. Має валідацію формату (10 цифр)."""
+    __slots__ = ()
+
     def __init__(self, value):
-        if not isinstance(value, str) or not value.isdigit() or len(value) != 10:
-            raise ValueError(
-                f"Номер телефону має складатися з 10 цифр, отримано: '{value}'"
-            )
-        super().__init__(value)
+        super().__init__(_validate_phone(value))
 
 
 class Birthday(Field):
     """Клас для зберігання дня народження з валідацією формату DD.MM.YYYY."""
+    __slots__ = ("_str", "month", "day")
+
     def __init__(self, value):
-        try:
-            self.value = datetime.strptime(value, "%d.%m.%Y").date()
-        except ValueError:
-            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        self.value, self._str = _parse_birthday(value)
+        self.month, self.day = self.value.month, self.value.day
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Старі збереження не мають похідних полів — відновлюємо їх з дати
+        self._str = self.value.strftime("%d.%m.%Y")
+        self.month, self.day = self.value.month, self.value.day
 
     def __str__(self):
-        return self.value.strftime("%d.%m.%Y")
+        return self._str
 
 
 class Record:
-    """Клас для зберігання інформації про контакт з іменем та списком телефонів."""
+    """Клас для зберігання інформації про контакт з іменем та телефонами."""
+    __slots__ = ("name", "phones", "birthday", "_str_cache")
+
     def __init__(self, name):
-        self.name = Name(name)
-        self.phones = []
+        self.name = Name(sys.intern(name))
+        self.phones = {}
         self.birthday = None
+        self._str_cache = None  # скидається при кожній зміні запису
 
     def add_phone(self, phone: str):
-        self.phones.append(Phone(phone))
+        self._store_phone(_validate_phone(phone))
+
+    def _store_phone(self, phone: str):
+        """Додає вже перевірений номер."""
+        self._str_cache = None
+        self.phones[phone] = None
 
     def remove_phone(self, phone: str):
-        phone_obj = self.find_phone(phone)
-        if phone_obj:
-            self.phones.remove(phone_obj)
-        else:
+        self._str_cache = None
+        try:
+            del self.phones[phone]
+        except KeyError:
             raise ValueError(
                 f"Телефон '{phone}' не знайдено в записі '{self.name.value}'"
-            )
+            ) from None
 
     def edit_phone(self, old_phone: str, new_phone: str):
-        phone_obj = self.find_phone(old_phone)
-        if phone_obj:
-            idx = self.phones.index(phone_obj)
-            self.phones[idx] = Phone(new_phone)
-        else:
+        self._str_cache = None
+        new_phone = _validate_phone(new_phone)
+        if old_phone not in self.phones:
             raise ValueError(
                 f"Телефон '{old_phone}' не знайдено в записі '{self.name.value}'"
             )
+        if new_phone != old_phone and new_phone in self.phones:
+            raise ValueError(
+                f"Телефон '{new_phone}' вже є в записі '{self.name.value}'"
+            )
+        # Перебудовуємо словник, щоб новий номер зайняв місце старого
+        self.phones = {
+            new_phone if phone == old_phone else phone: None for phone in self.phones
+        }
 
     def find_phone(self, phone: str):
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        return Phone(phone) if phone in self.phones else None
 
     def add_birthday(self, birthday: str):
+        self._str_cache = None
         self.birthday = Birthday(birthday)
 
+    def __getstate__(self):
+        # Кеш рядка не зберігаємо у файл — він живе лише в межах процесу
+        return {"name": self.name, "phones": self.phones, "birthday": self.birthday}
+
+    def __setstate__(self, state):
+        _restore_slots(self, state)
+        self._str_cache = None
+        if isinstance(self.phones, list):
+            # Старі збереження: список об'єктів Phone замість словника номерів
+            self.phones = dict.fromkeys(phone.value for phone in self.phones)
+
     def __str__(self):
-        phones = '; '.join(p.value for p in self.phones)
-        birthday = str(self.birthday) if self.birthday else "не вказано"
-        return f"Contact name: {self.name.value}, phones: {phones}, birthday: {birthday}"
+        if self._str_cache is None:
+            phones = '; '.join(self.phones)
+            birthday = str(self.birthday) if self.birthday else "не вказано"
+            self._str_cache = f"Contact name: {self.name.value}, phones: {phones}, birthday: {birthday}"
+        return self._str_cache
 
 
-class AddressBook(UserDict):
+class AddressBook(dict):
     """Клас для операцій над записами."""
+    def __setstate__(self, state):
+        state = dict(state)
+        # Книги, збережені ще як UserDict, тримають записи в атрибуті data
+        records = state.pop("data", None)
+        # Залишки індексу іменинників із проміжних версій більше не потрібні
+        state.pop("_bday_index", None)
+        state.pop("_bday_version", None)
+        self.__dict__.update(state)
+        if records:
+            self.update(records)
+
     def add_record(self, record: Record):
-        self.data[record.name.value] = record
+        self[record.name.value] = record
 
     def find(self, name: str) -> Record:
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name: str):
-        if name in self.data:
-            del self.data[name]
+        self.pop(name, None)
 
     def get_upcoming_birthdays(self):
         today = date.today()
         next_week = today + timedelta(days=7)
+        year = today.year
         upcoming = []
 
-        for record in self.data.values():
-            if not record.birthday:
+        # Локальні імена замість глобальних/атрибутних пошуків у циклі
+        birthday_in_year, shift_days, td = _birthday_in_year, _SHIFT_DAYS, timedelta
+        fmt, append = date.strftime, upcoming.append
+        for record in self.values():
+            bday = record.birthday
+            if bday is None:
                 continue
 
-            bday = record.birthday.value
-            bday_this_year = bday.replace(year=today.year)
-
+            bday_this_year = birthday_in_year(year, bday.month, bday.day)
             if bday_this_year < today:
-                bday_this_year = bday_this_year.replace(year=today.year + 1)
+                bday_this_year = birthday_in_year(year + 1, bday.month, bday.day)
 
-            if today <= bday_this_year <= next_week:
-                congratulation_date = bday_this_year
-                if congratulation_date.weekday() == 5:   # субота
-                    congratulation_date += timedelta(days=2)
-                elif congratulation_date.weekday() == 6: # неділя
-                    congratulation_date += timedelta(days=1)
-
-                upcoming.append({
+            if bday_this_year <= next_week:
+                congratulation_date = bday_this_year + td(
+                    days=shift_days[bday_this_year.weekday()]
+                )
+                append({
                     "name": record.name.value,
-                    "congratulation_date": congratulation_date.strftime("%d.%m.%Y")
+                    "congratulation_date": fmt(congratulation_date, "%d.%m.%Y")
                 })
 
         return upcoming
@@ -129,12 +230,14 @@ class AddressBook(UserDict):
 
 def save_data(book: AddressBook, filename: str = "addressbook.pkl"):
     """Зберігає адресну книгу у файл."""
+    import pickle  # потрібен лише при збереженні/завантаженні — не гальмуємо старт
     with open(filename, "wb") as f:
-        pickle.dump(book, f)
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_data(filename: str = "addressbook.pkl") -> AddressBook:
     """Завантажує адресну книгу з файлу. Якщо файл не знайдено — повертає нову книгу."""
+    import pickle
     try:
         with open(filename, "rb") as f:
             return pickle.load(f)
@@ -160,29 +263,29 @@ def input_error(func):
 # ───────────────────────── Обробники команд ─────────────────────────
 
 def parse_input(user_input: str):
-    parts = user_input.strip().split()
-    command = parts[0].lower() if parts else ""
-    args = parts[1:]
-    return command, *args
+    parts = user_input.split()  # split() без роздільника сам відкидає крайні пробіли
+    if not parts:
+        return "", []
+    return sys.intern(parts[0].lower()), parts[1:]
 
 
 @input_error
 def add_contact(args, book: AddressBook):
-    name, phone, *_ = args
+    name = args[0]
+    phone = _validate_phone(args[1])  # спершу перевіряємо номер, щоб не створити порожній запис
     record = book.find(name)
     message = "Contact updated."
     if record is None:
         record = Record(name)
         book.add_record(record)
         message = "Contact added."
-    if phone:
-        record.add_phone(phone)
+    record._store_phone(phone)
     return message
 
 
 @input_error
 def change_contact(args, book: AddressBook):
-    name, old_phone, new_phone, *_ = args
+    name, old_phone, new_phone = args[0], args[1], args[2]
     record = book.find(name)
     if record is None:
         raise KeyError(name)
@@ -192,16 +295,16 @@ def change_contact(args, book: AddressBook):
 
 @input_error
 def show_phone(args, book: AddressBook):
-    name, *_ = args
+    name = args[0]
     record = book.find(name)
     if record is None:
         raise KeyError(name)
-    return '; '.join(p.value for p in record.phones)
+    return '; '.join(record.phones)
 
 
 @input_error
 def add_birthday(args, book: AddressBook):
-    name, birthday, *_ = args
+    name, birthday = args[0], args[1]
     record = book.find(name)
     if record is None:
         raise KeyError(name)
@@ -211,7 +314,7 @@ def add_birthday(args, book: AddressBook):
 
 @input_error
 def show_birthday(args, book: AddressBook):
-    name, *_ = args
+    name = args[0]
     record = book.find(name)
     if record is None:
         raise KeyError(name)
@@ -229,51 +332,62 @@ def birthdays(args, book: AddressBook):
     return "\n".join(lines)
 
 
-# ───────────────────────── Головна функція ─────────────────────────
+@input_error
+def hello(args, book: AddressBook):
+    return "How can I help you?"
 
-def main():
-    book = load_data()  # ← відновлюємо книгу з файлу при старті
-    print("Welcome to the assistant bot!")
 
-    while True:
-        user_input = input("Enter a command: ")
-        command, *args = parse_input(user_input)
+@input_error
+def show_all(args, book: AddressBook):
+    if not book:
+        return "Адресна книга порожня."
+    return "\n".join(map(str, book.values()))
 
-        if command in ["close", "exit"]:
-            save_data(book)  # ← зберігаємо книгу перед виходом
-            print("Good bye!")
-            break
 
-        elif command == "hello":
-            print("How can I help you?")
+# Таблиця команд: один пошук у словнику замість ланцюжка if/elif
+COMMANDS = {
+    "hello": hello,
+    "add": add_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "all": show_all,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
 
-        elif command == "add":
-            print(add_contact(args, book))
 
-        elif command == "change":
-            print(change_contact(args, book))
+# ───────────────────────── Головна функція ─────────────────────────
 
-        elif command == "phone":
-            print(show_phone(args, book))
+def read_commands():
+    """Повертає рядки команд: через input() в терміналі, напряму з stdin у пайпі."""
+    if sys.stdin.isatty():
+        while True:
+            try:
+                yield input("Enter a command: ")
+            except EOFError:  # Ctrl+D — завершуємо так само, як і пайп
+                return
+    else:
+        # Скриптовий запуск — без запрошення та flush на кожному рядку
+        yield from sys.stdin
 
-        elif command == "all":
-            if book.data:
-                for record in book.data.values():
-                    print(record)
-            else:
-                print("Адресна книга порожня.")
 
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
+def main():
+    book = load_data()  # ← відновлюємо книгу з файлу при старті
+    print("Welcome to the assistant bot!")
 
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
+    for user_input in read_commands():
+        command, args = parse_input(user_input)
+
+        if command in ["close", "exit"]:
+            break
 
-        elif command == "birthdays":
-            print(birthdays(args, book))
+        handler = COMMANDS.get(command)
+        print(handler(args, book) if handler else "Invalid command.")
 
-        else:
-            print("Invalid command.")
+    # ← зберігаємо книгу перед виходом: і за командою, і коли закінчився ввід
+    save_data(book)
+    print("Good bye!")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+import main
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class LoadDataCompatibilityTest(unittest.TestCase):
+    """Файли, збережені попередніми версіями бота, мають і далі завантажуватися."""
+
+    def setUp(self):
+        self.book = main.load_data(os.path.join(FIXTURES, "addressbook_baseline.pkl"))
+
+    def test_loads_baseline_pickle(self):
+        self.assertIsInstance(self.book, main.AddressBook)
+        self.assertEqual(sorted(self.book), ["Ann", "Bob"])
+        self.assertNotIn("data", vars(self.book))
+
+    def test_phones_are_converted(self):
+        ann = self.book.find("Ann")
+        self.assertEqual(list(ann.phones), ["1234567890", "0987654321"])
+        self.assertEqual(
+            str(ann),
+            "Contact name: Ann, phones: 1234567890; 0987654321, birthday: 17.10.1990",
+        )
+        ann.edit_phone("0987654321", "1111111111")
+        self.assertEqual(list(ann.phones), ["1234567890", "1111111111"])
+
+    def test_birthdays_survive_reload(self):
+        self.assertEqual(str(self.book.find("Ann").birthday), "17.10.1990")
+        self.assertIsNone(self.book.find("Bob").birthday)
+
+    def test_resave_keeps_contacts(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        path = os.path.join(tmp_dir.name, "addressbook.pkl")
+        main.save_data(self.book, path)
+        self.assertEqual(sorted(main.load_data(path)), ["Ann", "Bob"])
+
+
+class RecordTest(unittest.TestCase):
+
+    def test_find_phone_returns_phone(self):
+        record = main.Record("Ann")
+        record.add_phone("1234567890")
+        found = record.find_phone("1234567890")
+        self.assertIsInstance(found, main.Phone)
+        self.assertEqual(found.value, "1234567890")
+        self.assertIsNone(record.find_phone("0987654321"))
+
+    def test_edit_phone_keeps_position(self):
+        record = main.Record("Ann")
+        record.add_phone("1111111111")
+        record.add_phone("2222222222")
+        record.edit_phone("1111111111", "3333333333")
+        self.assertEqual(list(record.phones), ["3333333333", "2222222222"])
+        self.assertEqual(
+            str(record), "Contact name: Ann, phones: 3333333333; 2222222222, birthday: не вказано"
+        )
+
+    def test_edit_phone_to_existing_number_fails(self):
+        record = main.Record("Ann")
+        record.add_phone("1111111111")
+        record.add_phone("2222222222")
+        with self.assertRaises(ValueError):
+            record.edit_phone("1111111111", "2222222222")
+        self.assertEqual(list(record.phones), ["1111111111", "2222222222"])
+
+    def test_str_cache_is_not_pickled(self):
+        record = main.Record("Ann")
+        record.add_phone("1234567890")
+        str(record)
+        self.assertNotIn(b"Contact name", pickle.dumps(record))
+        restored = pickle.loads(pickle.dumps(record))
+        self.assertIsNone(restored._str_cache)
+        self.assertEqual(str(restored), str(record))
+
+
+class BirthdayTest(unittest.TestCase):
+
+    def test_canonical_format(self):
+        birthday = main.Birthday("07.03.1995")
+        self.assertEqual(birthday.value, date(1995, 3, 7))
+        self.assertEqual(str(birthday), "07.03.1995")
+
+    def test_unpadded_day_and_month_are_accepted(self):
+        for value in ("7.3.1995", "07.3.1995", "7.03.1995"):
+            birthday = main.Birthday(value)
+            self.assertEqual(birthday.value, date(1995, 3, 7))
+            self.assertEqual(str(birthday), "07.03.1995")
+
+    def test_invalid_dates_are_rejected(self):
+        for value in ("31.02.2000", "29.02.2001", "01-01-2000", "01.01.20000", "+1.01.2000"):
+            with self.assertRaises(ValueError):
+                main.Birthday(value)
+
+
+class HandlersTest(unittest.TestCase):
+
+    def test_add_contact_with_invalid_phone_adds_nothing(self):
+        book = main.AddressBook()
+        self.assertIn("10 цифр", main.add_contact(["Ann", "123"], book))
+        self.assertIsNone(book.find("Ann"))
+        self.assertEqual(main.add_contact(["Ann", "1234567890"], book), "Contact added.")
+        self.assertEqual(main.add_contact(["Ann", "0987654321"], book), "Contact updated.")
+        self.assertEqual(main.show_phone(["Ann"], book), "1234567890; 0987654321")
+
+
+class UpcomingBirthdaysTest(unittest.TestCase):
+    """Список іменинників має враховувати будь-яку зміну книги чи запису."""
+
+    def setUp(self):
+        # Рік 2000 високосний, тож сьогоднішня дата завжди коректна
+        self.today = date.today().strftime("%d.%m.") + "2000"
+        self.far = (date.today() + timedelta(days=180)).strftime("%d.%m.") + "2000"
+
+    def make_record(self, name, birthday=None):
+        record = main.Record(name)
+        if birthday:
+            record.add_birthday(birthday)
+        return record
+
+    def upcoming_names(self, book):
+        return [entry["name"] for entry in book.get_upcoming_birthdays()]
+
+    def test_birthday_added_after_add_record(self):
+        book = main.AddressBook()
+        record = self.make_record("Ann")
+        book.add_record(record)
+        self.assertEqual(self.upcoming_names(book), [])
+        record.add_birthday(self.today)
+        self.assertEqual(self.upcoming_names(book), ["Ann"])
+
+    def test_birthday_assigned_directly(self):
+        book = main.AddressBook()
+        record = self.make_record("Ann", self.far)
+        book.add_record(record)
+        self.assertEqual(self.upcoming_names(book), [])
+        record.birthday = main.Birthday(self.today)
+        self.assertEqual(self.upcoming_names(book), ["Ann"])
+
+    def test_item_assignment_and_constructor(self):
+        book = main.AddressBook({"Ann": self.make_record("Ann", self.today)})
+        self.assertEqual(self.upcoming_names(book), ["Ann"])
+        book["Bob"] = self.make_record("Bob", self.today)
+        self.assertEqual(self.upcoming_names(book), ["Ann", "Bob"])
+
+    def test_removed_records_are_dropped(self):
+        book = main.AddressBook()
+        for name in ("Ann", "Bob", "Eve"):
+            book.add_record(self.make_record(name, self.today))
+        self.assertEqual(self.upcoming_names(book), ["Ann", "Bob", "Eve"])
+        del book["Ann"]
+        book.delete("Bob")
+        self.assertEqual(self.upcoming_names(book), ["Eve"])
+        book.pop("Eve")
+        self.assertEqual(self.upcoming_names(book), [])
+
+
+class MainLoopTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cwd = tmp_dir.name
+
+    def run_bot(self, commands):
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+        result = subprocess.run(
+            [sys.executable, script], input=commands, cwd=self.cwd,
+            capture_output=True, text=True, check=True,
+        )
+        return result.stdout
+
+    def test_saves_on_exit(self):
+        self.assertTrue(self.run_bot("add Ann 1234567890\nexit\n").endswith("Good bye!\n"))
+        self.assertIn("Contact name: Ann", self.run_bot("all\nexit\n"))
+
+    def test_saves_at_end_of_input(self):
+        self.assertTrue(self.run_bot("add Ann 1234567890\n").endswith("Good bye!\n"))
+        self.assertIn("Contact name: Ann", self.run_bot("all\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()